@@ -0,0 +1,23 @@
+import pytest
+from compact_person import CompactPerson
+
+
+class TestCompactPerson:
+    def test_person_name(self):
+        person = CompactPerson("Alice")
+        assert person.name == "Alice"
+
+    def test_uses_slots(self):
+        person = CompactPerson("Alice")
+        assert not hasattr(person, "__dict__")
+        with pytest.raises(AttributeError):
+            person.age = 30
+
+    def test_say_hello(self, capsys):
+        CompactPerson("Bob").say_hello()
+        assert capsys.readouterr().out == "Hello, my name is Bob\n"
+
+    def test_from_rows(self):
+        people = CompactPerson.from_rows([("Bob",), ["Charlie"]])
+        assert [p.name for p in people] == ["Bob", "Charlie"]
+        assert all(isinstance(p, CompactPerson) for p in people)
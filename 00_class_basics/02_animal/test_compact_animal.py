@@ -0,0 +1,41 @@
+import pytest
+from compact_animal import CompactAnimal
+
+
+class TestCompactAnimal:
+    def test_animal_attributes(self):
+        dog = CompactAnimal("Buddy", "Dog")
+        assert dog.name == "Buddy"
+        assert dog.species == "Dog"
+
+    def test_uses_slots(self):
+        cat = CompactAnimal("Whiskers", "Cat")
+        assert not hasattr(cat, "__dict__")
+        with pytest.raises(AttributeError):
+            cat.age = 3
+
+    def test_repr_method(self):
+        cat = CompactAnimal("Whiskers", "Cat")
+        assert repr(cat) == "Animal(name='Whiskers', species='Cat')"
+
+    def test_from_rows_interns_species(self):
+        # Build equal strings at runtime so they start as separate objects
+        rows = [("Rex", "".join(["D", "og"])), ("Max", "".join(["Do", "g"]))]
+        animals = CompactAnimal.from_rows(rows)
+        assert [a.name for a in animals] == ["Rex", "Max"]
+        assert animals[0].species is animals[1].species
+
+    def test_from_rows_without_interning(self):
+        rows = [("Rex", "".join(["D", "og"])), ("Max", "".join(["Do", "g"]))]
+        animals = CompactAnimal.from_rows(rows, intern_species=False)
+        assert animals[0].species == animals[1].species
+        assert animals[0].species is not animals[1].species
+
+    def test_from_csv(self):
+        animals = CompactAnimal.from_csv(["Rex,Dog", "Tom,Cat", "Max,Dog"])
+        assert [repr(a) for a in animals] == [
+            "Animal(name='Rex', species='Dog')",
+            "Animal(name='Tom', species='Cat')",
+            "Animal(name='Max', species='Dog')",
+        ]
+        assert animals[0].species is animals[2].species
@@ -0,0 +1,34 @@
+from fleet import Fleet
+
+
+class TestFleet:
+    def test_fleet_creation(self):
+        fleet = Fleet(3)
+        assert len(fleet) == 3
+        assert list(fleet.fuel) == [0, 0, 0]
+        assert list(fleet.mileage) == [0, 0, 0]
+
+    def test_add_fuel(self):
+        fleet = Fleet(3)
+        fleet.add_fuel([0, 2, 0], [10, 5, 2])
+        assert list(fleet.fuel) == [12, 0, 5]
+
+    def test_drive_all(self):
+        fleet = Fleet(3)
+        fleet.add_fuel([0, 2], [10, 1])
+        assert fleet.drive() == [True, False, True]
+        assert list(fleet.fuel) == [9, 0, 0]
+        assert list(fleet.mileage) == [1, 0, 1]
+
+    def test_drive_without_fuel(self):
+        fleet = Fleet(2)
+        assert fleet.drive() == [False, False]
+        assert list(fleet.fuel) == [0, 0]
+        assert list(fleet.mileage) == [0, 0]
+
+    def test_drive_selected_cars(self):
+        fleet = Fleet(3)
+        fleet.add_fuel([0, 2], [10, 1])
+        assert fleet.drive([2, 0, 2]) == [True, True, False]
+        assert list(fleet.fuel) == [9, 0, 0]
+        assert list(fleet.mileage) == [1, 0, 1]
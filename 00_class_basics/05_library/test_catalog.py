@@ -0,0 +1,54 @@
+from catalog import Catalog
+from library import Book
+
+
+class TestCatalog:
+    def test_catalog_creation(self):
+        catalog = Catalog()
+        assert catalog.books == []
+        assert len(catalog) == 0
+
+    def test_add_book(self):
+        catalog = Catalog()
+        book = Book("Dune", "Frank Herbert", "456")
+        catalog.add_book(book)
+        assert catalog.books == [book]
+        assert catalog.find_book("Dune") is book
+
+    def test_load(self):
+        catalog = Catalog()
+        books = [Book(f"Book {i}", "Author", str(i)) for i in range(100)]
+        catalog.load(books)
+        assert len(catalog) == 100
+        assert catalog.find_book("Book 42") is books[42]
+
+    def test_find_book_is_exact(self):
+        catalog = Catalog()
+        catalog.add_book(Book("Dune", "Frank Herbert", "456"))
+        assert catalog.find_book("dune") is None
+        assert catalog.find_book("Nonexistent Book") is None
+
+    def test_find_book_first_added_wins(self):
+        catalog = Catalog()
+        first = Book("Dune", "Frank Herbert", "456")
+        catalog.load([first, Book("Dune", "Someone Else", "999")])
+        assert catalog.find_book("Dune") is first
+
+    def test_find_by_author(self):
+        catalog = Catalog()
+        book1 = Book("1984", "George Orwell", "123")
+        book2 = Book("Dune", "Frank Herbert", "456")
+        book3 = Book("Animal Farm", "George Orwell", "124")
+        catalog.load([book1, book2])
+        catalog.add_book(book3)
+        assert catalog.find_by_author("George Orwell") == [book1, book3]
+        assert catalog.find_by_author("Nobody") == []
+
+    def test_search_prefix_ignores_case(self):
+        catalog = Catalog()
+        dune = Book("Dune", "Frank Herbert", "456")
+        messiah = Book("dune Messiah", "Frank Herbert", "457")
+        catalog.load([messiah, Book("1984", "George Orwell", "123")])
+        catalog.add_book(dune)
+        assert catalog.search_prefix("DU") == [dune, messiah]
+        assert catalog.search_prefix("x") == []
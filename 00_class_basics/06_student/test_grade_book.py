@@ -0,0 +1,61 @@
+import pytest
+from grade_book import GradeBook
+
+
+class TestGradeBook:
+    def test_grade_book_creation(self):
+        book = GradeBook()
+        assert book.grades == []
+        assert book.sums == []
+        assert book.counts == []
+
+    def test_add_grade_updates_running_totals(self):
+        book = GradeBook()
+        book.add_grade("S123", 85)
+        book.add_grade("S123", 92)
+        assert book.grades == [85, 92]
+        assert book.sums == [177]
+        assert book.counts == [2]
+
+    def test_average(self):
+        book = GradeBook()
+        book.add_grades([("S123", 85), ("S456", 78), ("S123", 92)])
+        assert book.average("S123") == 88.5
+        assert book.average("S456") == 78
+
+    def test_average_unknown_student(self):
+        book = GradeBook()
+        assert book.average("S999") == 0
+
+    def test_median(self):
+        book = GradeBook()
+        book.add_grades([("S1", 85), ("S1", 92), ("S2", 78), ("S3", 64)])
+        assert book.median() == 81.5
+        book.add_grade("S3", 100)
+        assert book.median() == 85
+
+    def test_percentile(self):
+        book = GradeBook()
+        book.add_grades([("S1", 10), ("S1", 20), ("S2", 30), ("S2", 40), ("S3", 50)])
+        assert book.percentile(0) == 10
+        assert book.percentile(25) == 20
+        assert book.percentile(90) == pytest.approx(46)
+        assert book.percentile(100) == 50
+
+    def test_percentile_out_of_range(self):
+        book = GradeBook()
+        book.add_grade("S1", 50)
+        with pytest.raises(ValueError):
+            book.percentile(101)
+
+    def test_histogram(self):
+        book = GradeBook()
+        book.add_grades([("S1", 85), ("S1", 92), ("S2", 78), ("S2", 88), ("S3", 100)])
+        assert book.histogram() == {70: 1, 80: 2, 90: 1, 100: 1}
+        assert list(book.histogram(bin_width=25)) == [75, 100]
+
+    def test_empty_grade_book_queries(self):
+        book = GradeBook()
+        assert book.median() == 0
+        assert book.percentile(50) == 0
+        assert book.histogram() == {}
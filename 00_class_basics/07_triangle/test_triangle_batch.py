@@ -0,0 +1,48 @@
+import pytest
+from triangle_batch import TriangleBatch
+
+
+class TestTriangleBatch:
+    def test_batch_creation(self):
+        batch = TriangleBatch([3, 6], [4, 8], [5, 10])
+        assert len(batch) == 2
+        assert list(batch.a) == [3.0, 6.0]
+
+    def test_mismatched_lengths(self):
+        with pytest.raises(ValueError):
+            TriangleBatch([3, 6], [4], [5, 10])
+
+    def test_valid_mask(self):
+        batch = TriangleBatch([3, 1, 0, 2], [4, 1, 1, 2], [5, 5, 1, 3])
+        assert batch.valid_mask() == [True, False, False, True]
+
+    def test_perimeters(self):
+        batch = TriangleBatch([3, 1], [4, 1], [5, 5])
+        assert batch.perimeters() == [12.0, 0.0]
+
+    def test_areas(self):
+        batch = TriangleBatch([3, 1, 2], [4, 1, 2], [5, 5, 2])
+        areas = batch.areas()
+        assert areas[0] == 6.0
+        assert areas[1] == 0.0
+        assert areas[2] == pytest.approx(3**0.5)
+
+    def test_areas_needle_triangle_is_stable(self):
+        batch = TriangleBatch([1e8], [1e8], [1e-3])
+        assert batch.areas()[0] == pytest.approx(50000.0, rel=1e-12)
+
+    def test_type_codes(self):
+        batch = TriangleBatch([3, 3, 5, 1], [3, 4, 5, 1], [3, 5, 8, 5])
+        assert batch.type_codes() == [0, 2, 1, -1]
+
+    def test_right_mask(self):
+        batch = TriangleBatch([5, 3, 2], [3, 4, 2], [4, 6, 2])
+        assert batch.right_mask() == [True, False, False]
+
+    def test_group_similar(self):
+        batch = TriangleBatch(
+            [3, 2, 10, 1, 4, 0.3],
+            [4, 2, 8, 1, 4, 0.4],
+            [5, 2, 6, 5, 4, 0.5],
+        )
+        assert batch.group_similar() == [[0, 2, 5], [1, 4]]
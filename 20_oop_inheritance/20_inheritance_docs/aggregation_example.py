@@ -10,8 +10,15 @@ Key Characteristics:
 - Loose coupling - components have their own lifecycle
 - Components can be part of multiple containers
 - Relationship can change at runtime
+
+Lifecycle events are opt-in: pass an `on_close` callable (an event sink)
+and it is called once with a message when the university is garbage
+collected. This uses `weakref.finalize` instead of `__del__`.
 """
 
+import weakref
+from itertools import islice
+
 
 # Independent classes that can exist on their own
 class Student:
@@ -127,8 +134,8 @@ class Course:
         self.credits = credits
         self.description = description
         self.universities = []  # Can be offered at multiple universities
-        self.enrolled_students = []
-        self.instructors = []
+        self.enrolled_students = {}  # Keyed by student_id
+        self.instructors = {}  # Keyed by employee_id
 
     def add_to_university(self, university):
         """Course can be added to university catalog"""
@@ -139,27 +146,26 @@ class Course:
 
     def enroll_student(self, student):
         """Student can enroll in course"""
-        if student not in self.enrolled_students:
-            self.enrolled_students.append(student)
+        if student.student_id not in self.enrolled_students:
+            self.enrolled_students[student.student_id] = student
             return f"{student.name} enrolled in {self.name}"
         return f"{student.name} already enrolled in {self.name}"
 
     def assign_instructor(self, professor):
         """Professor can be assigned to teach course"""
-        if professor not in self.instructors:
-            self.instructors.append(professor)
+        if professor.employee_id not in self.instructors:
+            self.instructors[professor.employee_id] = professor
             return f"Prof. {professor.name} assigned to {self.name}"
         return f"Prof. {professor.name} already teaching {self.name}"
 
     def get_info(self):
         unis = [uni.name for uni in self.universities]
-        students = [s.name for s in self.enrolled_students]
-        instructors = [p.name for p in self.instructors]
+        instructors = [p.name for p in self.instructors.values()]
         return (
             f"Course: {self.name} ({self.course_code})\n"
             f"Credits: {self.credits}\n"
             f"Offered at: {unis}\n"
-            f"Students: {len(students)} enrolled\n"
+            f"Students: {len(self.enrolled_students)} enrolled\n"
             f"Instructors: {instructors}"
         )
 
@@ -170,21 +176,23 @@ class Department:
     def __init__(self, name, university) -> None:
         self.name = name
         self.university = university
-        self.professors = []  # Aggregation - professors exist independently
-        self.courses = []  # Aggregation - courses exist independently
+        # Keyed by employee_id / course_code for O(1) membership checks;
+        # dicts keep insertion order, so listings read like the old lists
+        self.professors = {}  # Aggregation - professors exist independently
+        self.courses = {}  # Aggregation - courses exist independently
         self.head = None
 
     def add_professor(self, professor):
         """Add existing professor to department"""
-        if professor not in self.professors:
-            self.professors.append(professor)
+        if professor.employee_id not in self.professors:
+            self.professors[professor.employee_id] = professor
             return f"Prof. {professor.name} added to {self.name} department"
         return f"Prof. {professor.name} already in {self.name} department"
 
     def remove_professor(self, professor):
         """Remove professor from department (professor continues to exist)"""
-        if professor in self.professors:
-            self.professors.remove(professor)
+        if professor.employee_id in self.professors:
+            del self.professors[professor.employee_id]
             if self.head == professor:
                 self.head = None
             return f"Prof. {professor.name} removed from {self.name} department"
@@ -192,21 +200,21 @@ class Department:
 
     def add_course(self, course):
         """Add existing course to department"""
-        if course not in self.courses:
-            self.courses.append(course)
+        if course.course_code not in self.courses:
+            self.courses[course.course_code] = course
             return f"Course {course.name} added to {self.name} department"
         return f"Course {course.name} already in {self.name} department"
 
     def appoint_head(self, professor):
         """Appoint department head"""
-        if professor in self.professors:
+        if professor.employee_id in self.professors:
             self.head = professor
             return f"Prof. {professor.name} appointed as head of {self.name}"
         return f"Prof. {professor.name} must be in department first"
 
     def get_info(self):
-        prof_names = [p.name for p in self.professors]
-        course_names = [c.name for c in self.courses]
+        prof_names = [p.name for p in self.professors.values()]
+        course_names = [c.name for c in self.courses.values()]
         head_name = self.head.name if self.head else "None"
         return (
             f"Department: {self.name}\n"
@@ -225,31 +233,42 @@ class University:
     or exist without any university affiliation.
     """
 
-    def __init__(self, name, location, founded_year) -> None:
+    def __init__(self, name, location, founded_year, on_close=None) -> None:
         self.name = name
         self.location = location
         self.founded_year = founded_year
 
         # AGGREGATION: University aggregates existing independent objects
-        self.students = []  # Students exist independently
-        self.professors = []  # Professors exist independently
-        self.courses = []  # Courses exist independently
+        # Keyed by student_id / employee_id / course_code so enrolling,
+        # hiring and removing stay O(1) no matter how big the university gets
+        self.students = {}  # Students exist independently
+        self.professors = {}  # Professors exist independently
+        self.courses = {}  # Courses exist independently
         self.departments = []  # Departments are part of university structure
 
         print(f"University established: {self.name} ({self.founded_year})")
 
+        # LIFECYCLE: when university closes, aggregated objects continue to exist
+        if on_close is not None:
+            weakref.finalize(
+                self,
+                on_close,
+                f"University closed: {self.name}\n"
+                "Students, professors, and courses continue to exist independently.",
+            )
+
     def enroll_student(self, student):
         """Enroll an existing student"""
-        if student not in self.students:
-            self.students.append(student)
+        if student.student_id not in self.students:
+            self.students[student.student_id] = student
             student.enroll_in_university(self)
             return f"{student.name} enrolled at {self.name}"
         return f"{student.name} already enrolled at {self.name}"
 
     def graduate_student(self, student, year):
         """Graduate a student (student still exists as alumni)"""
-        if student in self.students:
-            self.students.remove(student)
+        if student.student_id in self.students:
+            del self.students[student.student_id]
             student.graduate(year)
             student.leave_university(self)
             return f"{student.name} graduated from {self.name} in {year}"
@@ -257,24 +276,24 @@ class University:
 
     def hire_professor(self, professor):
         """Hire an existing professor"""
-        if professor not in self.professors:
-            self.professors.append(professor)
+        if professor.employee_id not in self.professors:
+            self.professors[professor.employee_id] = professor
             professor.join_university(self)
             return f"Prof. {professor.name} hired at {self.name}"
         return f"Prof. {professor.name} already works at {self.name}"
 
     def dismiss_professor(self, professor):
         """Dismiss a professor (professor continues to exist)"""
-        if professor in self.professors:
-            self.professors.remove(professor)
+        if professor.employee_id in self.professors:
+            del self.professors[professor.employee_id]
             professor.leave_university(self)
             return f"Prof. {professor.name} left {self.name}"
         return f"Prof. {professor.name} doesn't work at {self.name}"
 
     def offer_course(self, course):
         """Add existing course to university catalog"""
-        if course not in self.courses:
-            self.courses.append(course)
+        if course.course_code not in self.courses:
+            self.courses[course.course_code] = course
             course.add_to_university(self)
             return f"Course {course.name} now offered at {self.name}"
         return f"Course {course.name} already offered at {self.name}"
@@ -304,26 +323,21 @@ class University:
 
         if self.students:
             info += f"\nSTUDENTS ({len(self.students)}):"
-            for student in self.students[:3]:  # Show first 3
+            for student in islice(self.students.values(), 3):  # Show first 3
                 info += f"\n- {student.name} ({student.major})"
 
         if self.professors:
             info += f"\nPROFESSORS ({len(self.professors)}):"
-            for prof in self.professors[:3]:  # Show first 3
+            for prof in islice(self.professors.values(), 3):  # Show first 3
                 info += f"\n- {prof.name} ({prof.department})"
 
         if self.courses:
             info += f"\nCOURSES ({len(self.courses)}):"
-            for course in self.courses[:3]:  # Show first 3
+            for course in islice(self.courses.values(), 3):  # Show first 3
                 info += f"\n- {course.name} ({course.credits} credits)"
 
         return info
 
-    def __del__(self) -> None:
-        """When university closes, aggregated objects continue to exist"""
-        print(f"University closed: {self.name}")
-        print("Students, professors, and courses continue to exist independently.")
-
 
 # Demonstration of Aggregation
 def demonstrate_aggregation():
@@ -354,8 +368,10 @@ def demonstrate_aggregation():
     # Create universities and aggregate existing objects
     print("\n2. UNIVERSITY CREATION AND AGGREGATION:")
     print("-" * 50)
-    tech_university = University("Tech University", "Silicon Valley", 1965)
-    state_college = University("State College", "Downtown", 1890)
+    tech_university = University(
+        "Tech University", "Silicon Valley", 1965, on_close=print
+    )
+    state_college = University("State College", "Downtown", 1890, on_close=print)
 
     # Aggregate existing objects
     print(f"   {tech_university.enroll_student(alice)}")
@@ -397,7 +413,9 @@ def demonstrate_aggregation():
 
     print("\n5. DYNAMIC RELATIONSHIPS - Objects can change affiliations:")
     print("-" * 50)
-    new_university = University("Innovation Institute", "Research Park", 2020)
+    new_university = University(
+        "Innovation Institute", "Research Park", 2020, on_close=print
+    )
     print(f"   {new_university.enroll_student(alice)}")
     print(f"   {new_university.hire_professor(prof_davis)}")
     print(f"   Alice and Dr. Davis joined the new university")
@@ -10,8 +10,18 @@ Key Characteristics:
 - Tight coupling - components are created and destroyed with container
 - Container controls component lifecycle
 - Components are integral parts of the whole
+
+Lifecycle events are opt-in: pass an `on_destroy` callable (an event sink)
+and it is called once with a message when the car is garbage collected.
+This uses `weakref.finalize` instead of `__del__`: the callback holds no
+reference to the car, and cars without a sink pay nothing extra. Like any
+finalizer, it runs when the car is collected, in no guaranteed order
+relative to other objects collected at the same time.
 """
 
+import weakref
+from array import array
+
 
 # Component classes - these will be "composed" into larger objects
 class Engine:
@@ -79,12 +89,20 @@ class Wheel:
         self.pressure = 32  # PSI
         self.wear_level = 0  # 0-100%
 
-    def rotate(self):
+    def add_rotation_wear(self):
+        """Wear from one drive, without building a message"""
         self.wear_level += 0.1
+
+    def add_braking_wear(self):
+        """Wear from one brake, without building a message"""
+        self.wear_level += 0.2
+
+    def rotate(self):
+        self.add_rotation_wear()
         return f'{self.size}" wheel rotating'
 
     def brake(self):
-        self.wear_level += 0.2
+        self.add_braking_wear()
         return f'{self.size}" wheel braking'
 
     def check_pressure(self):
@@ -137,7 +155,7 @@ class Car:
     Components cannot exist independently - they are integral parts of the car.
     """
 
-    def __init__(self, make, model, year) -> None:
+    def __init__(self, make, model, year, on_destroy=None) -> None:
         self.make = make
         self.model = model
         self.year = year
@@ -160,6 +178,17 @@ class Car:
         print(f"Car manufactured: {self.year} {self.make} {self.model}")
         print("Components created and integrated into the car.")
 
+        # LIFECYCLE: the finalizer must not hold a reference to self,
+        # so the message is built up front
+        if on_destroy is not None:
+            weakref.finalize(
+                self,
+                on_destroy,
+                f"Car demolished: {self.year} {self.make} {self.model}\n"
+                "All components (engine, transmission, wheels, fuel tank) "
+                "destroyed with the car.",
+            )
+
     def start_car(self):
         """Start the car - requires multiple components to work together"""
         if not self.is_started:
@@ -185,7 +214,8 @@ class Car:
         fuel_msg = self.fuel_tank.consume_fuel(fuel_needed)
 
         # Rotate wheels
-        wheel_messages = [wheel.rotate() for wheel in self.wheels]
+        for wheel in self.wheels:
+            wheel.add_rotation_wear()
 
         # Accelerate engine
         engine_msg = self.engine.accelerate()
@@ -195,7 +225,8 @@ class Car:
     def brake(self):
         """Brake the car - uses wheel components"""
         if self.is_started:
-            brake_messages = [wheel.brake() for wheel in self.wheels]
+            for wheel in self.wheels:
+                wheel.add_braking_wear()
             return f"Car braking! All wheels engaged."
         return "Car not running."
 
@@ -232,12 +263,75 @@ class Car:
 
         return "Maintenance Check:\n" + "\n".join(results)
 
-    def __del__(self) -> None:
-        """When car is destroyed, all components are destroyed too"""
-        print(f"Car demolished: {self.year} {self.make} {self.model}")
-        print(
-            "All components (engine, transmission, wheels, fuel tank) destroyed with the car."
-        )
+
+class CarFleet:
+    """
+    Simulates many identical cars without creating Car objects.
+
+    Each component's state lives in its own packed array (one slot per car)
+    instead of inside per-car Engine/Transmission/FuelTank/Wheel objects.
+    The rules match Car.drive(): 10L per 100km, a car with an empty tank
+    cannot drive, and each wheel wears 0.1% per drive. Nothing is printed
+    and no messages are built.
+    """
+
+    FUEL_PER_KM = 0.1
+    WHEEL_WEAR_PER_DRIVE = 0.1
+
+    def __init__(self, size, tank_capacity=60) -> None:
+        self.size = size
+        self.tank_capacity = tank_capacity
+        self.fuel = array("d", [tank_capacity * 0.8]) * size  # Start with 80% fuel
+        self.odometer = array("d", [0.0]) * size  # km driven
+        self.gear = array("b", [0]) * size  # 0 = Park, 1-6 = gears
+        self.engine_running = array("b", [0]) * size
+        self.wheel_wear = array("d", [0.0]) * size  # all 4 wheels wear equally
+
+    def start_all(self):
+        """Start every car that has fuel; returns how many are running"""
+        fuel, gear, running = self.fuel, self.gear, self.engine_running
+        for i in range(self.size):
+            if fuel[i] > 0:
+                running[i] = 1
+                gear[i] = 1
+        return sum(running)
+
+    def stop_all(self):
+        """Stop every car and shift to Park"""
+        self.engine_running = array("b", [0]) * self.size
+        self.gear = array("b", [0]) * self.size
+
+    def step(self, distance_km):
+        """Drive every running car with fuel left for one tick"""
+        fuel, odometer, wear = self.fuel, self.odometer, self.wheel_wear
+        running = self.engine_running
+        fuel_needed = distance_km * self.FUEL_PER_KM
+        for i in range(self.size):
+            if running[i] and fuel[i] > 0:
+                # Same rule as FuelTank.consume_fuel: run the tank dry if short
+                fuel[i] = fuel[i] - fuel_needed if fuel[i] >= fuel_needed else 0.0
+                odometer[i] += distance_km
+                wear[i] += self.WHEEL_WEAR_PER_DRIVE
+
+    def simulate(self, ticks, distance_km):
+        """Start the fleet and drive it for the given number of ticks"""
+        self.start_all()
+        for _ in range(ticks):
+            self.step(distance_km)
+        return self.get_statistics()
+
+    def get_statistics(self):
+        """Aggregate fuel and odometer statistics for the whole fleet"""
+        total_fuel = sum(self.fuel)
+        total_distance = sum(self.odometer)
+        return {
+            "cars": self.size,
+            "total_fuel": total_fuel,
+            "average_fuel": total_fuel / self.size if self.size else 0.0,
+            "total_distance": total_distance,
+            "average_distance": total_distance / self.size if self.size else 0.0,
+            "out_of_fuel": self.fuel.tolist().count(0.0),
+        }
 
 
 # Demonstration of Composition
@@ -251,7 +345,7 @@ def demonstrate_composition():
     # Create a car - this creates all components automatically
     print("\n1. OBJECT CREATION - Components created with container:")
     print("-" * 50)
-    my_car = Car("Toyota", "Camry", 2023)
+    my_car = Car("Toyota", "Camry", 2023, on_destroy=print)
 
     print("\n2. COMPONENT INTEGRATION - Components work together:")
     print("-" * 50)
@@ -280,7 +374,7 @@ def demonstrate_composition():
     # Create another car to show independent composition
     print("\n7. INDEPENDENT COMPOSITION:")
     print("-" * 50)
-    another_car = Car("Honda", "Civic", 2024)
+    another_car = Car("Honda", "Civic", 2024, on_destroy=print)
     print("   Each car has its own independent set of components.")
 
     print(f"\nCar 1 engine status: {my_car.engine.get_status()}")
@@ -290,6 +384,13 @@ def demonstrate_composition():
     print(f"\n   {my_car.stop_car()}")
     print(f"   {another_car.stop_car()}")
 
+    # Simulate a large fleet with component state packed into arrays
+    print("\n8. FLEET SIMULATION - Many cars without Car objects:")
+    print("-" * 50)
+    fleet_stats = CarFleet(1000).simulate(50, 5)
+    for name, value in fleet_stats.items():
+        print(f"   {name}: {round(value, 2)}")
+
     print("\n" + "=" * 60)
     print("KEY COMPOSITION CONCEPTS DEMONSTRATED:")
     print("=" * 60)
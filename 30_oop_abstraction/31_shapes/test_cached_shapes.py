@@ -0,0 +1,90 @@
+import math
+
+import pytest
+from cached_shapes import Circle, Rectangle, Shape, Triangle
+
+
+class CountingSquare(Shape):
+    def __init__(self, color, side) -> None:
+        super().__init__(color)
+        self.side = side
+        self.computed = []
+
+    def _compute_area(self):
+        self.computed.append("area")
+        return self.side**2
+
+    def _compute_perimeter(self):
+        return 4 * self.side
+
+
+class TestCachedShape:
+    def test_cannot_instantiate_abstract_shape(self):
+        with pytest.raises(TypeError):
+            Shape("red")
+
+    def test_area_is_computed_once(self):
+        square = CountingSquare("red", 3)
+        assert square.area() == 9
+        assert square.area() == 9
+        assert square.computed == ["area"]
+
+    def test_mutation_invalidates_cache(self):
+        square = CountingSquare("red", 3)
+        square.area()
+        square.side = 4
+        assert square.area() == 16
+        assert square.perimeter() == 16
+
+
+class TestShapes:
+    def test_rectangle(self):
+        rect = Rectangle("red", 10, 5)
+        assert rect.area() == 50
+        assert rect.perimeter() == 30
+        rect.width = 2
+        assert rect.area() == 10
+        assert rect.perimeter() == 14
+
+    def test_circle(self):
+        circle = Circle("blue", 7)
+        assert abs(circle.area() - math.pi * 49) < 0.01
+        assert abs(circle.perimeter() - 2 * math.pi * 7) < 0.01
+
+    def test_triangle(self):
+        triangle = Triangle("green", 5, 5, 6)
+        assert abs(triangle.area() - 12.0) < 0.01
+        triangle.side3 = 8
+        assert abs(triangle.area() - 12.0) < 0.01
+        assert triangle.perimeter() == 18
+
+
+class TestFrozenShape:
+    def test_freeze_returns_shape(self):
+        circle = Circle("blue", 7)
+        assert circle.is_frozen is False
+        assert circle.freeze() is circle
+        assert circle.is_frozen is True
+
+    def test_frozen_shape_rejects_assignment(self):
+        rect = Rectangle("red", 10, 5).freeze()
+        with pytest.raises(AttributeError):
+            rect.width = 20
+        with pytest.raises(AttributeError):
+            rect.color = "blue"
+        assert rect.width == 10
+
+    def test_frozen_shape_still_caches(self):
+        square = CountingSquare("red", 3).freeze()
+        assert square.area() == 9
+        assert square.area() == 9
+        assert square.computed == ["area"]
+
+    def test_frozen_builtin_shapes_compute(self):
+        rect = Rectangle("red", 10, 5).freeze()
+        assert rect.area() == 50
+        assert rect.perimeter() == 30
+        circle = Circle("blue", 7).freeze()
+        assert abs(circle.area() - math.pi * 49) < 0.01
+        assert abs(circle.perimeter() - 2 * math.pi * 7) < 0.01
+        assert circle.area() == circle.area()
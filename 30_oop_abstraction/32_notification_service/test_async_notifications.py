@@ -0,0 +1,93 @@
+import asyncio
+import time
+
+import pytest
+from notification_service import EmailNotification, PushNotification, SMSNotification
+
+
+class FakeTransport:
+    def __init__(self, latency=0.0, failing=()) -> None:
+        self.latency = latency
+        self.failing = set(failing)
+        self.delivered = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def deliver(self, service_name, recipient, message):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+        if recipient in self.failing:
+            return False
+        self.delivered.append((service_name, recipient, message))
+        return True
+
+
+class TestSendAsync:
+    def test_send_async_success(self, capsys):
+        transport = FakeTransport()
+        email = EmailNotification(transport=transport)
+        result = asyncio.run(email.send_async("user@example.com", "Hello"))
+        assert result is True
+        assert email.sent_count == 1
+        assert transport.delivered == [("Email Service", "user@example.com", "Hello")]
+        assert "SUCCESS" in capsys.readouterr().out
+
+    def test_invalid_recipient_skips_transport(self, capsys):
+        transport = FakeTransport()
+        sms = SMSNotification(transport=transport)
+        result = asyncio.run(sms.send_async("1234567890", "Hello"))
+        assert result is False
+        assert sms.sent_count == 0
+        assert transport.delivered == []
+        assert "FAILED" in capsys.readouterr().out
+
+    def test_transport_failure(self):
+        transport = FakeTransport(failing=["device_abc123"])
+        push = PushNotification(transport=transport)
+        result = asyncio.run(push.send_async("device_abc123", "Hello"))
+        assert result is False
+        assert push.sent_count == 0
+
+    def test_send_async_without_transport(self):
+        email = EmailNotification()
+        with pytest.raises(RuntimeError):
+            asyncio.run(email.send_async("user@example.com", "Hello"))
+
+
+class TestSendManyAsync:
+    def test_results_in_recipient_order(self):
+        transport = FakeTransport(failing=["bob@test.com"])
+        email = EmailNotification(transport=transport)
+        recipients = ["alice@test.com", "bob@test.com", "invalid", "carol@test.com"]
+        results = asyncio.run(email.send_many_async(recipients, "Hi"))
+        assert results == [True, False, False, True]
+        assert email.sent_count == 2
+
+    def test_concurrency_is_limited(self):
+        transport = FakeTransport(latency=0.01)
+        email = EmailNotification(transport=transport, max_concurrency=5)
+        recipients = [f"user{i}@example.com" for i in range(40)]
+        asyncio.run(email.send_many_async(recipients, "Hi"))
+        assert transport.max_in_flight == 5
+        assert len(transport.delivered) == 40
+
+    def test_sends_overlap(self):
+        transport = FakeTransport(latency=0.05)
+        email = EmailNotification(transport=transport, max_concurrency=50)
+        recipients = [f"user{i}@example.com" for i in range(50)]
+        start = time.perf_counter()
+        results = asyncio.run(email.send_many_async(recipients, "Hi"))
+        elapsed = time.perf_counter() - start
+        assert all(results)
+        assert elapsed < 50 * 0.05 / 2
+
+    def test_service_reused_across_event_loops(self):
+        transport = FakeTransport(latency=0.001)
+        email = EmailNotification(transport=transport, max_concurrency=2)
+        recipients = [f"user{i}@example.com" for i in range(10)]
+        assert all(asyncio.run(email.send_many_async(recipients, "Hi")))
+        assert all(asyncio.run(email.send_many_async(recipients, "Hi")))
+        assert transport.max_in_flight == 2
+        assert email.sent_count == 20
@@ -0,0 +1,71 @@
+from notification_service import EmailNotification, PushNotification, SMSNotification
+
+
+class TestSendBatch:
+    def test_returns_bytearray_statuses(self):
+        sms = SMSNotification()
+        statuses = sms.send_batch(["+1234567890", "1234567890", "+1987654321"], "Hi")
+        assert isinstance(statuses, bytearray)
+        assert list(statuses) == [1, 0, 1]
+
+    def test_updates_sent_count(self):
+        push = PushNotification()
+        push.send_batch(["device_abc123", "abc", "device_xyz789"], "Hi")
+        assert push.sent_count == 2
+        push.send_batch(["device_000001"], "Hi")
+        assert push.sent_count == 3
+
+    def test_one_delivery_line_per_valid_recipient(self, capsys):
+        sms = SMSNotification()
+        sms.send_batch(["+1234567890", "bad", "+1987654321", "also-bad"], "Code 1234")
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 3
+        assert "+1234567890" in lines[0]
+        assert "Code 1234" in lines[0]
+        assert "+1987654321" in lines[1]
+        assert "Code 1234" in lines[1]
+        assert "SMS Service: 4 recipients - 2 SUCCESS, 2 FAILED" in lines[2]
+
+    def test_push_batch_delivers_message(self, capsys):
+        push = PushNotification()
+        push.send_batch(["device_abc123", "abc"], "New follower")
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 2
+        assert "device_abc123" in lines[0]
+        assert "New follower" in lines[0]
+        assert (
+            "Push Notification Service: 2 recipients - 1 SUCCESS, 1 FAILED" in lines[1]
+        )
+
+    def test_empty_batch(self, capsys):
+        push = PushNotification()
+        statuses = push.send_batch([], "Hi")
+        assert statuses == bytearray()
+        assert push.sent_count == 0
+        assert "0 recipients - 0 SUCCESS, 0 FAILED" in capsys.readouterr().out
+
+    def test_large_batch_output_stays_small(self, capsys):
+        email = EmailNotification()
+        recipients = [f"user{i}@example.com" for i in range(10_000)]
+        statuses = email.send_batch(recipients, "Newsletter")
+        assert statuses.count(1) == 10_000
+        assert email.sent_count == 10_000
+        assert len(capsys.readouterr().out.strip().splitlines()) == 2
+
+
+class TestEmailBatchOverride:
+    def test_email_overrides_send_batch(self):
+        assert "send_batch" in EmailNotification.__dict__
+        assert "send_batch" not in SMSNotification.__dict__
+
+    def test_email_batch_output(self, capsys):
+        email = EmailNotification()
+        statuses = email.send_batch(
+            ["alice@test.com", "invalid", "bob@test.com"], "Sale"
+        )
+        assert list(statuses) == [1, 0, 1]
+        assert email.sent_count == 2
+        lines = capsys.readouterr().out.strip().splitlines()
+        assert len(lines) == 2
+        assert lines[0] == "Sending email batch to 2 recipients: Sale"
+        assert "Email Service: 3 recipients - 2 SUCCESS, 1 FAILED" in lines[1]
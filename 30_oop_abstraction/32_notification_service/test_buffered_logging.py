@@ -0,0 +1,141 @@
+import asyncio
+import re
+import time
+
+from notification_service import (
+    EmailNotification,
+    LogSink,
+    SMSNotification,
+    classic_format,
+    structured_format,
+)
+
+CLASSIC_LINE = re.compile(
+    r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}\] (.+): (.+) - (.+)$"
+)
+
+
+class TestFormatters:
+    def test_structured_format(self):
+        line = structured_format(
+            1_700_000_000_000_000_000, "SMS Service", "+123456", "SUCCESS"
+        )
+        assert line == "1700000000000000000\tSMS Service\t+123456\tSUCCESS"
+
+    def test_classic_format(self):
+        line = classic_format(
+            time.time_ns(), "Email Service", "user@example.com", "FAILED"
+        )
+        match = CLASSIC_LINE.match(line)
+        assert match is not None
+        assert match.groups() == ("Email Service", "user@example.com", "FAILED")
+
+
+class TestLogSink:
+    def test_record_and_read(self):
+        sink = LogSink(capacity=10)
+        sink.record("Email Service", "a@b.com", "SUCCESS")
+        sink.record("Email Service", "invalid", "FAILED")
+        assert len(sink) == 2
+        records = sink.records()
+        assert [r[1:] for r in records] == [
+            ("Email Service", "a@b.com", "SUCCESS"),
+            ("Email Service", "invalid", "FAILED"),
+        ]
+        assert records[0][0] <= records[1][0]
+        assert isinstance(records[0][0], int)
+
+    def test_ring_buffer_overwrites_oldest(self):
+        sink = LogSink(capacity=3)
+        for i in range(5):
+            sink.record("SMS Service", f"+{i}", "SUCCESS")
+        assert len(sink) == 3
+        assert sink.dropped == 2
+        assert [r[2] for r in sink.records()] == ["+2", "+3", "+4"]
+
+    def test_drain_empties_buffer(self):
+        sink = LogSink(capacity=2)
+        for i in range(3):
+            sink.record("SMS Service", f"+{i}", "SUCCESS")
+        assert [r[2] for r in sink.drain()] == ["+1", "+2"]
+        assert len(sink) == 0
+        assert sink.records() == []
+        sink.record("SMS Service", "+9", "FAILED")
+        assert [r[2] for r in sink.records()] == ["+9"]
+
+    def test_format_is_deferred_and_keeps_records(self):
+        sink = LogSink()
+        sink.record("Email Service", "a@b.com", "SUCCESS")
+        lines = sink.format(classic_format)
+        assert CLASSIC_LINE.match(lines[0]).groups() == (
+            "Email Service",
+            "a@b.com",
+            "SUCCESS",
+        )
+        assert len(sink) == 1
+
+    def test_format_uses_wall_clock_time(self):
+        sink = LogSink()
+        before = time.time_ns()
+        sink.record("Email Service", "a@b.com", "SUCCESS")
+        time_ns = int(sink.format()[0].split("\t")[0])
+        assert abs(time_ns - before) < 1_000_000_000
+
+    def test_flush_writes_batches(self, tmp_path):
+        path = tmp_path / "notifications.log"
+        sink = LogSink()
+        for i in range(5):
+            sink.record("SMS Service", f"+{i}", "SUCCESS")
+        written = asyncio.run(sink.flush(path, batch_size=2))
+        assert written == 5
+        assert len(sink) == 0
+        lines = path.read_text().splitlines()
+        assert [line.split("\t")[2] for line in lines] == ["+0", "+1", "+2", "+3", "+4"]
+
+    def test_flush_appends(self, tmp_path):
+        path = tmp_path / "notifications.log"
+        sink = LogSink()
+        sink.record("SMS Service", "+1", "SUCCESS")
+        asyncio.run(sink.flush(path))
+        sink.record("SMS Service", "+2", "FAILED")
+        asyncio.run(sink.flush(path, formatter=classic_format))
+        lines = path.read_text().splitlines()
+        assert len(lines) == 2
+        assert lines[0].endswith("\tSUCCESS")
+        assert CLASSIC_LINE.match(lines[1]).groups() == ("SMS Service", "+2", "FAILED")
+
+
+class TestServiceLogging:
+    def test_default_still_prints(self, capsys):
+        email = EmailNotification()
+        email.log_notification("user@example.com", "SUCCESS")
+        assert CLASSIC_LINE.match(capsys.readouterr().out.strip())
+        assert email.sent_count == 1
+
+    def test_sink_replaces_printing(self, capsys):
+        sink = LogSink()
+        sms = SMSNotification()
+        sms.log_sink = sink
+        sms.log_notification("+1234567890", "SUCCESS")
+        sms.log_notification("+1234567890", "FAILED")
+        assert capsys.readouterr().out == ""
+        assert sms.sent_count == 1
+        assert [r[1:] for r in sink.records()] == [
+            ("SMS Service", "+1234567890", "SUCCESS"),
+            ("SMS Service", "+1234567890", "FAILED"),
+        ]
+
+    def test_send_uses_sink(self, capsys):
+        sink = LogSink()
+        email = EmailNotification()
+        email.log_sink = sink
+        assert email.send("user@example.com", "Hello") is True
+        output = capsys.readouterr().out
+        assert "Sending email to user@example.com: Hello" in output
+        assert "SUCCESS" not in output
+        assert sink.records()[0][3] == "SUCCESS"
+
+    def test_sink_is_per_service(self):
+        email = EmailNotification()
+        email.log_sink = LogSink()
+        assert EmailNotification().log_sink is None
@@ -0,0 +1,90 @@
+import pytest
+from notification_service import (
+    EmailNotification,
+    MinLengthValidator,
+    PushNotification,
+    RecipientValidator,
+    RegexValidator,
+    SMSNotification,
+)
+
+
+class TestRecipientValidator:
+    def test_is_abstract(self):
+        with pytest.raises(TypeError):
+            RecipientValidator()
+
+    def test_regex_validator_full_match(self):
+        validator = RegexValidator(r"\+\d+")
+        assert validator.is_valid("+1234567890") is True
+        assert validator.is_valid("+12 34") is False
+        assert validator.is_valid("1234567890") is False
+        assert validator.is_valid("+123abc") is False
+
+    def test_pattern_is_compiled(self):
+        validator = RegexValidator(r"[^@\s]+@[^@\s]+")
+        assert hasattr(validator.pattern, "fullmatch")
+
+    def test_min_length_validator(self):
+        validator = MinLengthValidator(6)
+        assert validator.is_valid("device") is True
+        assert validator.is_valid("dev1") is False
+
+    def test_results_are_cached(self):
+        calls = []
+
+        class CountingValidator(RecipientValidator):
+            def check(self, recipient):
+                calls.append(recipient)
+                return recipient.startswith("ok")
+
+        validator = CountingValidator()
+        for _ in range(5):
+            assert validator.is_valid("ok-1") is True
+            assert validator.is_valid("bad") is False
+        assert calls == ["ok-1", "bad"]
+        info = validator.cache_info()
+        assert info.hits == 8
+        assert info.misses == 2
+
+    def test_cache_size(self):
+        validator = MinLengthValidator(3, cache_size=2)
+        assert validator.cache_info().maxsize == 2
+
+    def test_validate_many_mask(self):
+        validator = RegexValidator(r"[^@\s]+@[^@\s]+")
+        mask = validator.validate_many(["a@b.com", "invalid", "c@d.org", "a@b.com"])
+        assert isinstance(mask, bytearray)
+        assert list(mask) == [1, 0, 1, 1]
+        assert validator.validate_many([]) == bytearray()
+
+
+class TestServiceValidators:
+    def test_services_have_shared_validators(self):
+        assert isinstance(EmailNotification.validator, RegexValidator)
+        assert isinstance(SMSNotification.validator, RegexValidator)
+        assert isinstance(PushNotification.validator, MinLengthValidator)
+        assert EmailNotification().validator is EmailNotification().validator
+
+    def test_rules_match_original_checks(self):
+        assert EmailNotification().validate_recipient("a\n@b") is True
+        assert SMSNotification().validate_recipient("+1\n2") is True
+
+    def test_validate_recipient_uses_cache(self):
+        email = EmailNotification()
+        before = EmailNotification.validator.cache_info().hits
+        email.validate_recipient("cached-user@example.com")
+        EmailNotification().validate_recipient("cached-user@example.com")
+        assert EmailNotification.validator.cache_info().hits > before
+
+    def test_service_validate_many(self):
+        push = PushNotification()
+        mask = push.validate_many(["device_abc123", "abc", "device_xyz789"])
+        assert list(mask) == [1, 0, 1]
+
+    def test_validate_many_repeated_recipients(self):
+        sms = SMSNotification()
+        recipients = ["+1234567890", "bad", "+1987654321"] * 10_000
+        mask = sms.validate_many(recipients)
+        assert len(mask) == 30_000
+        assert mask.count(1) == 20_000
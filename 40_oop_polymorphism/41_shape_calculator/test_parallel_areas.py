@@ -0,0 +1,156 @@
+import math
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+
+class Shape(ABC):
+    def __init__(self, color) -> None:
+        self.color = color
+
+    @abstractmethod
+    def area(self):
+        pass
+
+    @abstractmethod
+    def perimeter(self):
+        pass
+
+
+class Rectangle(Shape):
+    def __init__(self, color, width, height) -> None:
+        super().__init__(color)
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def perimeter(self):
+        return 2 * (self.width + self.height)
+
+
+class Circle(Shape):
+    def __init__(self, color, radius) -> None:
+        super().__init__(color)
+        self.radius = radius
+
+    def area(self):
+        return math.pi * self.radius**2
+
+    def perimeter(self):
+        return 2 * math.pi * self.radius
+
+
+class Triangle(Shape):
+    def __init__(self, color, side1, side2, side3) -> None:
+        super().__init__(color)
+        self.side1 = side1
+        self.side2 = side2
+        self.side3 = side3
+
+    def area(self):
+        s = (self.side1 + self.side2 + self.side3) / 2
+        return math.sqrt(s * (s - self.side1) * (s - self.side2) * (s - self.side3))
+
+    def perimeter(self):
+        return self.side1 + self.side2 + self.side3
+
+
+try:
+    from shape_calculator import (
+        calculate_total_area,
+        chunked_areas,
+        filter_by_area,
+        sort_shapes_by_area,
+    )
+except ImportError:
+
+    def chunked_areas(shapes, executor=None, chunk_size=1000):
+        raise NotImplementedError("Implement chunked_areas()")
+
+    def calculate_total_area(shapes, executor=None, chunk_size=1000):
+        raise NotImplementedError("Implement calculate_total_area()")
+
+    def filter_by_area(shapes, min_area, executor=None, chunk_size=1000):
+        raise NotImplementedError("Implement filter_by_area()")
+
+    def sort_shapes_by_area(shapes, executor=None, chunk_size=1000):
+        raise NotImplementedError("Implement sort_shapes_by_area()")
+
+
+class RecordingExecutor(ThreadPoolExecutor):
+    def __init__(self) -> None:
+        super().__init__(max_workers=4)
+        self.chunk_sizes = []
+
+    def map(self, fn, *iterables, **kwargs):
+        chunks = list(iterables[0])
+        self.chunk_sizes = [len(chunk) for chunk in chunks]
+        return super().map(fn, chunks, **kwargs)
+
+
+@pytest.fixture
+def many_shapes():
+    shapes = []
+    for i in range(1, 301):
+        shapes.append(Rectangle(f"rect{i}", i % 7 + 1, i % 5 + 1))
+        shapes.append(Circle(f"circle{i}", (i % 11) / 3 + 0.1))
+        shapes.append(Triangle(f"triangle{i}", 5, 5, i % 9 + 1))
+    return shapes
+
+
+@pytest.fixture
+def executor():
+    with RecordingExecutor() as executor:
+        yield executor
+
+
+class TestChunkedAreas:
+    def test_chunks_are_consecutive(self, executor):
+        shapes = [Rectangle("red", i, 1) for i in range(10)]
+        areas = chunked_areas(shapes, executor=executor, chunk_size=3)
+        assert areas == list(range(10))
+        assert executor.chunk_sizes == [3, 3, 3, 1]
+
+    def test_without_executor(self):
+        shapes = [Rectangle("red", i, 2) for i in range(5)]
+        assert chunked_areas(shapes) == [0, 2, 4, 6, 8]
+
+
+class TestParallelCalculator:
+    def test_total_area_matches_sequential(self, many_shapes, executor):
+        sequential = calculate_total_area(many_shapes)
+        parallel = calculate_total_area(many_shapes, executor=executor, chunk_size=64)
+        assert parallel == pytest.approx(sequential, rel=1e-12)
+        assert parallel == math.fsum(shape.area() for shape in many_shapes)
+
+    def test_total_area_empty(self, executor):
+        assert calculate_total_area([], executor=executor) == 0
+
+    def test_filter_keeps_order(self, many_shapes, executor):
+        parallel = filter_by_area(many_shapes, 20, executor=executor, chunk_size=50)
+        expected = [shape for shape in many_shapes if shape.area() >= 20]
+        assert parallel == expected
+
+    def test_sort_is_stable(self, executor):
+        shapes = [Rectangle(f"r{i}", 2 + i % 3, 5) for i in range(30)]
+        parallel = sort_shapes_by_area(shapes, executor=executor, chunk_size=4)
+        assert parallel == sorted(shapes, key=lambda shape: shape.area())
+
+    def test_custom_shape(self, executor):
+        class Square(Shape):
+            def __init__(self, color, side) -> None:
+                super().__init__(color)
+                self.side = side
+
+            def area(self):
+                return self.side**2
+
+            def perimeter(self):
+                return 4 * self.side
+
+        shapes = [Square("red", side) for side in range(1, 11)]
+        total = calculate_total_area(shapes, executor=executor, chunk_size=3)
+        assert total == 385
@@ -0,0 +1,86 @@
+import math
+
+import pytest
+from shape_collection import Circle, Rectangle, Shape, ShapeCollection, Triangle
+
+
+class Square(Shape):
+    def __init__(self, color, side) -> None:
+        super().__init__(color)
+        self.side = side
+
+    def area(self):
+        return self.side**2
+
+    def perimeter(self):
+        return 4 * self.side
+
+
+class DoubleRectangle(Rectangle):
+    def area(self):
+        return 2 * super().area()
+
+
+@pytest.fixture
+def collection():
+    collection = ShapeCollection()
+    collection.extend(
+        [
+            Rectangle("red", 10, 5),  # area = 50
+            Circle("blue", 5),  # area = 78.54
+            Triangle("green", 5, 5, 6),  # area = 12
+            Rectangle("yellow", 3, 3),  # area = 9
+            Circle("purple", 2),  # area = 12.57
+        ]
+    )
+    return collection
+
+
+class TestShapeCollection:
+    def test_columns(self, collection):
+        assert len(collection) == 5
+        assert list(collection.widths) == [10, 3]
+        assert list(collection.radii) == [5, 2]
+        assert list(collection.sides3) == [6]
+        assert collection.others == []
+
+    def test_total_area(self, collection):
+        expected = 50 + math.pi * 25 + 12 + 9 + math.pi * 4
+        assert abs(collection.total_area() - expected) < 0.01
+
+    def test_total_area_empty(self):
+        assert ShapeCollection().total_area() == 0
+
+    def test_filter_by_area_keeps_insertion_order(self, collection):
+        filtered = collection.filter_by_area(12)
+        assert [shape.color for shape in filtered] == ["red", "blue", "green", "purple"]
+
+    def test_sort_by_area(self, collection):
+        sorted_shapes = collection.sort_by_area()
+        colors = [shape.color for shape in sorted_shapes]
+        assert colors == ["yellow", "green", "purple", "red", "blue"]
+
+    def test_largest(self, collection):
+        assert collection.largest().color == "blue"
+
+    def test_largest_tie_first_wins(self):
+        collection = ShapeCollection()
+        collection.extend([Rectangle("red", 5, 2), Rectangle("blue", 2, 5)])
+        assert collection.largest().color == "red"
+
+    def test_largest_empty(self):
+        assert ShapeCollection().largest() is None
+
+
+class TestFallback:
+    def test_custom_shape_uses_area_method(self, collection):
+        collection.add(Square("black", 10))
+        assert collection.others[0].color == "black"
+        assert collection.largest().color == "black"
+
+    def test_subclass_is_not_vectorized(self):
+        collection = ShapeCollection()
+        collection.extend([Rectangle("red", 10, 5), DoubleRectangle("blue", 10, 5)])
+        assert list(collection.widths) == [10]
+        assert collection.total_area() == 150
+        assert [s.color for s in collection.sort_by_area()] == ["red", "blue"]
@@ -0,0 +1,140 @@
+import io
+import json
+import math
+from abc import ABC, abstractmethod
+
+import pytest
+
+
+class Shape(ABC):
+    def __init__(self, color) -> None:
+        self.color = color
+
+    @abstractmethod
+    def area(self):
+        pass
+
+    @abstractmethod
+    def perimeter(self):
+        pass
+
+
+class Rectangle(Shape):
+    def __init__(self, color, width, height) -> None:
+        super().__init__(color)
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def perimeter(self):
+        return 2 * (self.width + self.height)
+
+
+class Circle(Shape):
+    def __init__(self, color, radius) -> None:
+        super().__init__(color)
+        self.radius = radius
+
+    def area(self):
+        return math.pi * self.radius**2
+
+    def perimeter(self):
+        return 2 * math.pi * self.radius
+
+
+class Triangle(Shape):
+    def __init__(self, color, side1, side2, side3) -> None:
+        super().__init__(color)
+        self.side1 = side1
+        self.side2 = side2
+        self.side3 = side3
+
+    def area(self):
+        s = (self.side1 + self.side2 + self.side3) / 2
+        return math.sqrt(s * (s - self.side1) * (s - self.side2) * (s - self.side3))
+
+    def perimeter(self):
+        return self.side1 + self.side2 + self.side3
+
+
+try:
+    from shape_report import format_shape_line, shape_report, write_shape_report
+except ImportError:
+
+    def format_shape_line(shape):
+        raise NotImplementedError("Implement format_shape_line()")
+
+    def write_shape_report(shapes, out, fmt="text"):
+        raise NotImplementedError("Implement write_shape_report()")
+
+    def shape_report(shapes, fmt="text"):
+        raise NotImplementedError("Implement shape_report()")
+
+
+@pytest.fixture
+def sample_shapes():
+    return [
+        Rectangle("red", 10, 5),  # area = 50
+        Circle("blue", 7),  # area = 153.94
+        Triangle("green", 5, 5, 6),  # area = 12
+    ]
+
+
+class TestFormatShapeLine:
+    def test_rectangle_line(self):
+        line = format_shape_line(Rectangle("red", 10, 5))
+        assert line == "red Rectangle - Area: 50.00, Perimeter: 30.00"
+
+    def test_circle_line(self):
+        line = format_shape_line(Circle("blue", 7))
+        assert line == "blue Circle - Area: 153.94, Perimeter: 43.98"
+
+
+class TestTextReport:
+    def test_text_report(self, sample_shapes):
+        report = shape_report(sample_shapes)
+        assert report == (
+            "red Rectangle - Area: 50.00, Perimeter: 30.00\n"
+            "blue Circle - Area: 153.94, Perimeter: 43.98\n"
+            "green Triangle - Area: 12.00, Perimeter: 16.00\n"
+            f"{'─' * 45}\n"
+            "Total Area: 215.94\n"
+        )
+
+    def test_write_to_any_writer(self, sample_shapes):
+        out = io.StringIO()
+        total = write_shape_report(sample_shapes, out)
+        assert abs(total - (50 + math.pi * 49 + 12)) < 0.01
+        assert out.getvalue() == shape_report(sample_shapes)
+
+    def test_empty_report(self):
+        assert shape_report([]).endswith("Total Area: 0.00\n")
+
+
+class TestOtherFormats:
+    def test_csv_report(self, sample_shapes):
+        lines = shape_report(sample_shapes, fmt="csv").splitlines()
+        assert lines[0] == "color,type,area,perimeter"
+        assert lines[1] == "red,Rectangle,50,30"
+        assert len(lines) == 4
+
+    def test_json_report(self, sample_shapes):
+        data = json.loads(shape_report(sample_shapes, fmt="json"))
+        assert [shape["type"] for shape in data["shapes"]] == [
+            "Rectangle",
+            "Circle",
+            "Triangle",
+        ]
+        assert data["shapes"][0] == {
+            "color": "red",
+            "type": "Rectangle",
+            "area": 50,
+            "perimeter": 30,
+        }
+        assert abs(data["total_area"] - (50 + math.pi * 49 + 12)) < 0.01
+
+    def test_unknown_format(self, sample_shapes):
+        with pytest.raises(ValueError):
+            shape_report(sample_shapes, fmt="xml")
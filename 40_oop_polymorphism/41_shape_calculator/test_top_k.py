@@ -0,0 +1,132 @@
+import math
+from abc import ABC, abstractmethod
+
+
+class Shape(ABC):
+    def __init__(self, color) -> None:
+        self.color = color
+
+    @abstractmethod
+    def area(self):
+        pass
+
+    @abstractmethod
+    def perimeter(self):
+        pass
+
+
+class Rectangle(Shape):
+    def __init__(self, color, width, height) -> None:
+        super().__init__(color)
+        self.width = width
+        self.height = height
+
+    def area(self):
+        return self.width * self.height
+
+    def perimeter(self):
+        return 2 * (self.width + self.height)
+
+
+class Circle(Shape):
+    def __init__(self, color, radius) -> None:
+        super().__init__(color)
+        self.radius = radius
+
+    def area(self):
+        return math.pi * self.radius**2
+
+    def perimeter(self):
+        return 2 * math.pi * self.radius
+
+
+class Triangle(Shape):
+    def __init__(self, color, side1, side2, side3) -> None:
+        super().__init__(color)
+        self.side1 = side1
+        self.side2 = side2
+        self.side3 = side3
+
+    def area(self):
+        s = (self.side1 + self.side2 + self.side3) / 2
+        return math.sqrt(s * (s - self.side1) * (s - self.side2) * (s - self.side3))
+
+    def perimeter(self):
+        return self.side1 + self.side2 + self.side3
+
+
+try:
+    from top_k import find_largest_streaming, top_k_by_area
+except ImportError:
+
+    def top_k_by_area(shapes, k):
+        raise NotImplementedError("Implement top_k_by_area()")
+
+    def find_largest_streaming(shapes):
+        raise NotImplementedError("Implement find_largest_streaming()")
+
+
+class CountingCircle(Circle):
+    calls = 0
+
+    def area(self):
+        CountingCircle.calls += 1
+        return super().area()
+
+
+def shape_feed():
+    yield Rectangle("red", 10, 5)  # area = 50
+    yield Circle("blue", 5)  # area = 78.54
+    yield Triangle("green", 5, 5, 6)  # area = 12
+    yield Rectangle("yellow", 3, 3)  # area = 9
+    yield Circle("purple", 2)  # area = 12.57
+
+
+class TestTopKByArea:
+    def test_top_k_largest_first(self):
+        top = top_k_by_area(shape_feed(), 3)
+        assert [shape.color for shape in top] == ["blue", "red", "purple"]
+
+    def test_top_k_more_than_available(self):
+        top = top_k_by_area(shape_feed(), 10)
+        assert [shape.color for shape in top] == [
+            "blue",
+            "red",
+            "purple",
+            "green",
+            "yellow",
+        ]
+
+    def test_top_k_zero_or_empty(self):
+        assert top_k_by_area(shape_feed(), 0) == []
+        assert top_k_by_area(iter([]), 3) == []
+
+    def test_top_k_ties_first_wins(self):
+        shapes = [
+            Rectangle("red", 5, 2),
+            Rectangle("blue", 2, 5),
+            Rectangle("green", 10, 1),
+        ]
+        top = top_k_by_area(iter(shapes), 2)
+        assert [shape.color for shape in top] == ["red", "blue"]
+
+    def test_area_called_once_per_shape(self):
+        CountingCircle.calls = 0
+        shapes = (CountingCircle("red", radius) for radius in range(1, 101))
+        top = top_k_by_area(shapes, 5)
+        assert [shape.radius for shape in top] == [100, 99, 98, 97, 96]
+        assert CountingCircle.calls == 100
+
+
+class TestFindLargestStreaming:
+    def test_largest_from_generator(self):
+        largest = find_largest_streaming(shape_feed())
+        assert largest.color == "blue"
+
+    def test_largest_all_same_area(self):
+        shapes = (s for s in [Rectangle("red", 5, 2), Rectangle("blue", 2, 5)])
+        largest = find_largest_streaming(shapes)
+        assert largest.color == "red"
+
+    def test_largest_empty(self):
+        assert find_largest_streaming(iter([])) is None